@@ -1,8 +1,11 @@
 import argparse
+import re
 from typing import Union
 
 from src.utils import logger
 
+_LIFE_RE = re.compile(r"life", re.IGNORECASE).search
+
 
 def get_meaning_of_life(question: str) -> Union[int, str]:
     """Returns the answer to life, universe and everything.
@@ -13,7 +16,7 @@ def get_meaning_of_life(question: str) -> Union[int, str]:
     Returns:
         42 if the question is about life, error message otherwise
     """
-    if "life" in question.lower():
+    if _LIFE_RE(question):
         return 42
 
     raise ValueError("Question not deep enough")
@@ -30,6 +33,6 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    logger.glitch(f"Reflecting on question 🧠: {args.question}")
+    logger.glitch("Reflecting on question 🧠: %s", args.question)
     result = get_meaning_of_life(args.question)
-    logger.success(f"The answer is {result}")
+    logger.success("The answer is %s", result)
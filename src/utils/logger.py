@@ -1,44 +1,71 @@
 import json
 import logging
+import os
 import random
 import sys
+import threading
 import time
 import traceback
 from html.parser import HTMLParser
 from pathlib import Path
-from typing import Any, Iterable, Optional, Union
+from typing import Any, Iterable, Mapping, Optional, Union
 
 from tqdm import tqdm
 
 
-def strip_tags(html: str) -> str:
-    """
-    Strip HTML tags from a string
-    """
+class MLStripper(HTMLParser):
+    """HTML parser that only keeps text content"""
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+        self.strict = False
+        self.convert_charrefs = True
+
+    def reset(self):
+        super().reset()
+        self.text = []
+
+    def handle_data(self, d):
+        self.text.append(d)
 
-    class MLStripper(HTMLParser):
-        def __init__(self):
-            super().__init__()
-            self.reset()
-            self.strict = False
-            self.convert_charrefs = True
-            self.text = []
+    def get_data(self):
+        return "".join(self.text)
 
-        def handle_data(self, d):
-            self.text.append(d)
 
-        def get_data(self):
-            return "".join(self.text)
+# One reusable parser per thread, HTMLParser instances are not thread-safe
+_STRIPPER = threading.local()
 
-    s = MLStripper()
+
+def strip_tags(html: str) -> str:
+    """
+    Strip HTML tags from a string
+    """
+    s = getattr(_STRIPPER, "parser", None)
+    if s is None:
+        s = _STRIPPER.parser = MLStripper()
+    else:
+        s.reset()
     s.feed(html)
     return s.get_data()
 
 
+_PRIMITIVES = frozenset((str, int, float, bool, type(None)))
+
+
 def sanitize(v):
     """
     Helper function to convert non-serializable values to string representations.
     """
+    # Exact type checks first, isinstance only for subclasses
+    t = type(v)
+    if t in _PRIMITIVES:
+        return v
+    if t is list or t is tuple:
+        return [sanitize(x) for x in v]
+    if t is dict:
+        return {str(k): sanitize(val) for k, val in v.items()}
+
     if isinstance(v, (str, int, float, bool, type(None))):
         return v
     elif isinstance(v, (list, tuple)):
@@ -50,30 +77,82 @@ def sanitize(v):
         return f"{v.__class__.__name__}({str(v)})"
 
 
-def pprint(o):
-    """Format any object to a printable string"""
+# Non-serializable values are converted inline with sanitize
+_ENCODER = json.JSONEncoder(indent=4, sort_keys=True, default=sanitize)
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), default=sanitize)
+
+
+def _looks_like_json(s: str) -> bool:
+    """Cheap check that a string may be a JSON object or array"""
+    s = s.strip()
+    return len(s) >= 2 and s[0] in "{[" and s[-1] in "}]"
+
+
+def pprint(o, pretty: bool = True):
+    """
+    Format any object to a printable string
+
+    Args:
+        o: Object to format
+        pretty: Indent and sort JSON output, otherwise keep it compact
+    """
+    encoder = _ENCODER if pretty else _COMPACT_ENCODER
     if isinstance(o, str):
-        if "html" in o:
+        if "<" in o and "html" in o:
             return strip_tags(o)[:500]
+        if not _looks_like_json(o):
+            # Plain text: not worth a JSON parsing attempt
+            return o
         try:
-            return json.dumps(json.loads(o), indent=4, sort_keys=True)
+            return encoder.encode(json.loads(o))
         except ValueError:
             return o
     elif isinstance(o, dict) or isinstance(o, list):
         try:
-            return json.dumps(o, indent=4, sort_keys=True)
+            return encoder.encode(o)
+        except ValueError:
+            # Circular reference
+            return str(o)
         except TypeError:
+            # Keys that cannot be serialized or sorted
             try:
-                if isinstance(o, dict):
-                    sanitized = {str(k): sanitize(v) for k, v in o.items()}
-                else:
-                    sanitized = [sanitize(v) for v in o]
-                return json.dumps(sanitized, indent=4, sort_keys=True)
+                return encoder.encode(sanitize(o))
             except Exception:
                 return str(o)
     return str(o)
 
 
+class _FileFormatter(logging.Formatter):
+    """Formatter writing the file-specific variant of a message, if any"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        file_text = getattr(record, "file_text", None)
+        return super().format(record) if file_text is None else file_text
+
+
+# Characters and colors randomly picked by Logger.glitch
+_GLITCH_CHARS = (
+    "█",
+    "▓",
+    "▒",
+    "░",
+    "▄",
+    "▀",
+    "▐",
+    "▌",
+    "▄",
+    "|",
+    "/",
+    "\\",
+    "#",
+    "@",
+    "&",
+    "?",
+    "!",
+)
+_GLITCH_COLORS = ("error", "success", "warning", "info", "magenta", "cyan")
+
+
 class Logger:
     """
     Unified logger for the IIIF downloader that handles:
@@ -125,8 +204,9 @@ class Logger:
         self.logger = logging.getLogger("python-project")
         self.logger.setLevel(logging.INFO)
 
-        # Write errors in log file
+        # Write errors in log file, unbuffered so that a crash cannot lose them
         fh = logging.FileHandler(self.error_log)
+        fh.setFormatter(_FileFormatter())
         fh.setLevel(logging.ERROR)
         self.logger.addHandler(fh)
 
@@ -135,10 +215,36 @@ class Logger:
         ch.setLevel(logging.INFO)
         self.logger.addHandler(ch)
 
-    @staticmethod
-    def _get_timestamp() -> str:
-        """Get current timestamp in readable format."""
-        return time.strftime("%Y-%m-%d %H:%M:%S")
+        self._ts_cache = (0, "")
+
+        # Pretty-print JSON only when a human is likely to read it:
+        # log messages go to the console handler stream (stderr), glitch to stdout
+        self._pretty = ch.stream.isatty()
+        self._stdout_tty = sys.stdout.isatty()
+        # Animate glitch messages only for interactive terminals
+        self._tty = self._stdout_tty and os.environ.get("FAST_LOG") != "1"
+
+        # Precompute ANSI sequences used on every log call
+        bold = self.COLORS["bold"]
+        # (emoji, color prefix) per message type, looked up once per message
+        self._msg_style = {
+            k: (self.EMOJIS.get(k, ""), f"{v}{bold}") for k, v in self.COLORS.items()
+        }
+        self._default_style = ("", bold)
+        self._end = self.COLORS["end"]
+        self._header = "\n\n\n"
+        self._glitch_white = self.COLORS["white"]
+        self._glitch_colors = tuple(self.COLORS[c] for c in _GLITCH_COLORS)
+
+    def _get_timestamp(self) -> str:
+        """Get current timestamp in readable format, rebuilt once per second."""
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (
+                now,
+                time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)),
+            )
+        return self._ts_cache[1]
 
     def get_color(self, color: str) -> str:
         """Get the ANSI color code for a message type."""
@@ -148,15 +254,58 @@ class Logger:
         """Get the ANSI color code for a message type."""
         return self.EMOJIS.get(color, "")
 
-    def format_message(self, *msg: Any, msg_type: str = "info") -> str:
-        """Format a message with timestamp and colors."""
-        color = self.get_color(msg_type)
-        emoji = self.get_emoji(msg_type)
-        timestamp = self._get_timestamp()
+    @staticmethod
+    def _render(msg: Any, args: tuple, pretty: bool) -> str:
+        """
+        Merge args into msg %-style, a single mapping being used for
+        %(key)s placeholders as in logging.
+
+        If msg is not a format string matching args, each value is printed
+        on its own line instead. Values that cannot be printed at all are
+        replaced by a placeholder, so rendering never raises.
+        """
+        try:
+            if not args:
+                return pprint(msg, pretty)
+            values = args
+            if len(args) == 1 and isinstance(args[0], Mapping) and args[0]:
+                values = args[0]
+            return pprint(msg % values, pretty)
+        except Exception:
+            pass
+        try:
+            return "\n".join(pprint(m, pretty) for m in (msg, *args))
+        except Exception as e:
+            return f"<unprintable message: {e.__class__.__name__}: {e}>"
+
+    def format_message(
+        self,
+        msg: Any,
+        *args: Any,
+        msg_type: str = "info",
+        pretty: Optional[bool] = None,
+    ) -> str:
+        """Format a message with timestamp and colors.
+
+        If args are given, msg is treated as a %-style format string.
+        JSON is pretty-printed if the console is a terminal, unless pretty is given.
+        """
+        if pretty is None:
+            pretty = self._pretty
+        return "".join(
+            (
+                self._format_head(msg_type),
+                self._render(msg, args, pretty),
+                self._end,
+                self._header,
+            )
+        )
 
-        formatted = "\n".join([f"{color}{self.COLORS['bold']}{pprint(m)}" for m in msg])
-        return (
-            f"\n\n\n{emoji}  {timestamp}\n{color}{formatted}{self.COLORS['end']}\n\n\n"
+    def _format_head(self, msg_type: str) -> str:
+        """Format the emoji, timestamp and color prefix preceding a message."""
+        emoji, prefix = self._msg_style.get(msg_type, self._default_style)
+        return "".join(
+            (self._header, emoji, "\xa0\xa0", self._get_timestamp(), "\n", prefix)
         )
 
     @staticmethod
@@ -167,47 +316,80 @@ class Logger:
 
         return msg
 
-    def error(self, *msg: Any, exception: Optional[Exception] = None):
+    def _emit(self, level: int, text: str, file_text: Optional[str] = None):
+        """
+        Hand an already formatted message to the handlers.
+
+        The record is built directly, skipping the caller lookup done by
+        logging.Logger.log, which none of the handlers use.
+        file_text optionally replaces text in the log file.
+        """
+        record = self.logger.makeRecord(
+            self.logger.name, level, "(unknown file)", 0, text, None, None
+        )
+        record.file_text = file_text
+        self.logger.handle(record)
+
+    def _log(self, level: int, msg_type: str, msg: Any, *args: Any):
+        """Format and emit a message, only if the level is enabled."""
+        if not self.logger.isEnabledFor(level):
+            return
+        self._emit(level, self.format_message(msg, *args, msg_type=msg_type))
+
+    def error(self, msg: Any, *args: Any, exception: Optional[Exception] = None):
         """
         🚨 Log an error message and optionally an exception
 
         Args:
-            msg: Message to log
+            msg: Message to log, or %-style format string if args are given
+            args: Arguments merged into msg
             exception: Optional exception to include in log
         """
-        error_msg = self.format_message(*msg, msg_type="error")
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        head = self._format_head("error")
+        body = self._render(msg, args, self._pretty)
+        tail = f"{self._end}{self._header}"
         if exception:
-            error_msg += self.format_exception(exception)
+            tail += self.format_exception(exception)
+
+        # Keep JSON compact in error.log even when the console gets it indented:
+        # pretty JSON always spans several lines, single-line bodies are shared
+        file_msg = None
+        if self._pretty and "\n" in body:
+            compact = self._render(msg, args, False)
+            if compact != body:
+                file_msg = "".join((head, compact, tail))
 
-        self.logger.error(error_msg)
+        self._emit(logging.ERROR, "".join((head, body, tail)), file_msg)
 
-    def warning(self, *msg: Any):
+    def warning(self, msg: Any, *args: Any):
         """⚠️ Log a warning message."""
-        self.logger.warning(self.format_message(*msg, msg_type="warning"))
+        self._log(logging.WARNING, "warning", msg, *args)
 
-    def info(self, *msg: Any):
+    def info(self, msg: Any, *args: Any):
         """ℹ️ Log an info message."""
-        self.logger.info(self.format_message(*msg, msg_type="info"))
+        self._log(logging.INFO, "info", msg, *args)
 
-    def magic(self, *msg: Any):
+    def magic(self, msg: Any, *args: Any):
         """🔮 Log a magical message."""
-        self.logger.info(self.format_message(*msg, msg_type="magenta"))
+        self._log(logging.INFO, "magenta", msg, *args)
 
-    def water(self, *msg: Any):
+    def water(self, msg: Any, *args: Any):
         """🪼 Log a watery message."""
-        self.logger.info(self.format_message(*msg, msg_type="cyan"))
+        self._log(logging.INFO, "cyan", msg, *args)
 
-    def white(self, *msg: Any):
+    def white(self, msg: Any, *args: Any):
         """🏳 Log a white message."""
-        self.logger.info(self.format_message(*msg, msg_type="white"))
+        self._log(logging.INFO, "white", msg, *args)
 
-    def black(self, *msg: Any):
+    def black(self, msg: Any, *args: Any):
         """️🏴 Log a black message."""
-        self.logger.info(self.format_message(*msg, msg_type="black"))
+        self._log(logging.INFO, "black", msg, *args)
 
-    def success(self, *msg: Any):
+    def success(self, msg: Any, *args: Any):
         """✅ Log a success message."""
-        self.logger.info(self.format_message(*msg, msg_type="success"))
+        self._log(logging.INFO, "success", msg, *args)
 
     @staticmethod
     def stdout(txt: str):
@@ -215,39 +397,38 @@ class Logger:
         sys.stdout.write(txt)
         sys.stdout.flush()
 
-    def glitch(self, *msg: Any, intensity: float = 0.4):
-        """🪞 Log a glitch message."""
-        glitched_chars = [
-            "█",
-            "▓",
-            "▒",
-            "░",
-            "▄",
-            "▀",
-            "▐",
-            "▌",
-            "▄",
-            "|",
-            "/",
-            "\\",
-            "#",
-            "@",
-            "&",
-            "?",
-            "!",
-        ]
-        colors = ["error", "success", "warning", "info", "magenta", "cyan"]
-        for m in msg:
-            m = pprint(m)
-            for char in m:
-                if random.random() < intensity:
-                    self.stdout(
-                        f"{self.get_color('white')}{random.choice(glitched_chars)}{self.COLORS['end']}"
-                    )
-                    time.sleep(0.05)
-                color = self.get_color(random.choice(colors))
-                self.stdout(f"{color}{char}{self.COLORS['end']}")
-                time.sleep(0.075)
+    def glitch(self, msg: Any, *args: Any, intensity: float = 0.4, chunk_size: int = 4):
+        """
+        🪞 Log a glitch message.
+
+        Args:
+            msg: Message to log, or %-style format string if args are given
+            args: Arguments merged into msg
+            intensity: Probability of inserting a glitched character
+            chunk_size: Number of characters written at once on a terminal
+        """
+        white, end = self._glitch_white, self._end
+        colors, chars = self._glitch_colors, _GLITCH_CHARS
+        n_colors, n_chars = len(colors), len(chars)
+
+        # Non-interactive output is rendered at once, without pauses
+        buf = []
+        delay = 0.0
+        for i, char in enumerate(self._render(msg, args, self._stdout_tty), 1):
+            if random.random() < intensity:
+                buf.append(f"{white}{chars[random.randrange(n_chars)]}{end}")
+                delay += 0.05
+            buf.append(f"{colors[random.randrange(n_colors)]}{char}{end}")
+            delay += 0.075
+            if self._tty and i % chunk_size == 0:
+                self.stdout("".join(buf))
+                buf.clear()
+                time.sleep(delay)
+                delay = 0.0
+        if buf:
+            self.stdout("".join(buf))
+            if self._tty:
+                time.sleep(delay)
 
     @staticmethod
     def progress(
@@ -274,5 +455,23 @@ class Logger:
         )
 
 
+class _LazyLogger:
+    """
+    Proxy to the global Logger, created on first use so that importing
+    this module does not create the log directory nor open log files
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        global _logger
+        if _logger is None:
+            # Two Logger instances would attach duplicate handlers
+            with _logger_lock:
+                if _logger is None:
+                    _logger = Logger()
+        return getattr(_logger, name)
+
+
 # Create a global logger instance
-logger = Logger()
+_logger: Optional[Logger] = None
+_logger_lock = threading.Lock()
+logger = _LazyLogger()
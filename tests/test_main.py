@@ -1,18 +1,23 @@
+import re
+
 import pytest
 
+import src.main
 from src.main import get_meaning_of_life
 
 
 @pytest.mark.parametrize(
     "question,expected",
     [
-        ("What is the meaning of life?", 42),
-        ("Tell me about LIFE please", 42),
-        ("life", 42),
-        ("LIFE", 42),
-        ("What's the purpose of life in the universe?", 42),
-        ("Why does life exist?", 42),
-        ("   What is the meaning of    LiFe    ?", 42),
+        pytest.param("What is the meaning of life?", 42, id="meaning"),
+        pytest.param("Tell me about LIFE please", 42, id="uppercase"),
+        pytest.param("life", 42, id="lowercase-only"),
+        pytest.param("LIFE", 42, id="uppercase-only"),
+        pytest.param("What's the purpose of life in the universe?", 42, id="universe"),
+        pytest.param("Why does life exist?", 42, id="existence"),
+        pytest.param(
+            "   What is the meaning of    LiFe    ?", 42, id="mixed-case-spaces"
+        ),
     ],
 )
 def test_valid_life_questions(question, expected):
@@ -24,12 +29,12 @@ def test_valid_life_questions(question, expected):
 @pytest.mark.parametrize(
     "invalid_question",
     [
-        "What is love?",
-        "Why is the sky blue?",
-        "How many stars are there?",
-        "Tell me about the universe",
-        "",
-        "   ",
+        pytest.param("What is love?", id="love"),
+        pytest.param("Why is the sky blue?", id="sky"),
+        pytest.param("How many stars are there?", id="stars"),
+        pytest.param("Tell me about the universe", id="universe"),
+        pytest.param("", id="empty"),
+        pytest.param("   ", id="blank"),
     ],
 )
 def test_invalid_questions(invalid_question):
@@ -38,3 +43,10 @@ def test_invalid_questions(invalid_question):
         get_meaning_of_life(invalid_question)
 
     assert str(exc_info.value) == "Question not deep enough"
+
+
+def test_life_pattern_precompiled():
+    """Test that the 'life' pattern is compiled once, case-insensitively"""
+    pattern = src.main._LIFE_RE.__self__
+    assert isinstance(pattern, re.Pattern)
+    assert pattern.flags & re.IGNORECASE
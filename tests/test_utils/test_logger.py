@@ -0,0 +1,298 @@
+import logging
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from src.utils.logger import Logger, pprint, sanitize, strip_tags
+
+
+@pytest.fixture
+def new_logger(tmp_path):
+    """Fixture for a factory of Loggers writing to a temporary directory."""
+    shared = logging.getLogger("python-project")
+    handlers = list(shared.handlers)
+    yield lambda: Logger(tmp_path)
+    # Only detach the handlers added by the created instances
+    for handler in shared.handlers[:]:
+        if handler not in handlers:
+            shared.removeHandler(handler)
+            handler.close()
+
+
+@pytest.fixture
+def log(new_logger):
+    """Fixture for a Logger writing to a temporary directory."""
+    return new_logger()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Just a plain message",
+        "   indented message",
+        "a < b and b > c",
+        "",
+    ],
+)
+def test_pprint_plain_text(text):
+    """Test that plain strings are returned unchanged"""
+    assert pprint(text) == text
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ('{"b": 1, "a": 2}', '{\n    "a": 2,\n    "b": 1\n}'),
+        ("  [1, 2]", "[\n    1,\n    2\n]"),
+        ("[not json", "[not json"),
+        ("[not json]", "[not json]"),
+    ],
+)
+def test_pprint_json_string(text, expected):
+    """Test that JSON strings are pretty-printed and invalid JSON is kept as is"""
+    assert pprint(text) == expected
+
+
+def test_pprint_html():
+    """Test that HTML strings are stripped from their tags"""
+    assert pprint("<html><body><p>Hello</p></body></html>") == "Hello"
+
+
+def test_strip_tags():
+    """Test that consecutive calls to strip_tags do not share state"""
+    assert strip_tags("<p>first</p>") == "first"
+    assert strip_tags("<b>second</b>") == "second"
+
+
+class Point:
+    def __str__(self):
+        return "1, 2"
+
+
+class Unprintable:
+    def __str__(self):
+        raise RuntimeError("no str")
+
+
+def test_sanitize():
+    """Test that nested structures are made JSON serializable"""
+    assert sanitize({"a": (1, Point()), 2: [None, True]}) == {
+        "a": [1, "Point(1, 2)"],
+        "2": [None, True],
+    }
+
+
+@pytest.mark.parametrize(
+    "obj,expected",
+    [
+        ({"b": Point(), "a": 1}, '{\n    "a": 1,\n    "b": "Point(1, 2)"\n}'),
+        ([Point()], '[\n    "Point(1, 2)"\n]'),
+        ({1: "int", "a": "str"}, '{\n    "1": "int",\n    "a": "str"\n}'),
+    ],
+)
+def test_pprint_non_serializable(obj, expected):
+    """Test that objects json cannot serialize are still printed"""
+    assert pprint(obj) == expected
+
+
+def test_pprint_compact():
+    """Test that JSON is kept on a single line when pretty is disabled"""
+    assert pprint({"b": [1, 2], "a": Point()}, pretty=False) == (
+        '{"b":[1,2],"a":"Point(1, 2)"}'
+    )
+    assert pprint('{"b": 1, "a": 2}', pretty=False) == '{"b":1,"a":2}'
+
+
+@pytest.mark.parametrize(
+    "msg,args,expected",
+    [
+        pytest.param("value %s", (42,), "value 42", id="format-args"),
+        pytest.param("Header", ("detail",), "Header\ndetail", id="extra-values"),
+        pytest.param(42, ("x",), "42\nx", id="non-string-msg"),
+        pytest.param("100% done %s", (1,), "100% done %s\n1", id="stray-percent"),
+        pytest.param("%(a)s and %(b)s", ({"a": 1, "b": 2},), "1 and 2", id="mapping"),
+        pytest.param("x %s", (Unprintable(),), "<unprintable message: ", id="bad-str"),
+    ],
+)
+def test_log_args(log, caplog, msg, args, expected):
+    """Test that args are merged %-style, or printed line by line otherwise"""
+    log.info(msg, *args)
+    assert expected in caplog.records[-1].getMessage()
+
+
+def test_log_circular(log, caplog):
+    """Test that self-referencing structures are printed without raising"""
+    circular = [1]
+    circular.append(circular)
+    log.info(circular)
+    assert "[1, [...]]" in caplog.records[-1].getMessage()
+
+
+def test_format_message_header(log):
+    """Test that the emoji and timestamp are separated by non-breaking spaces"""
+    assert log.format_message("x", msg_type="success").startswith("\n\n\n✅\xa0\xa0")
+
+
+def test_disabled_level_skips_formatting(log, caplog, monkeypatch):
+    """Test that messages below the logger level are not formatted"""
+    caplog.set_level(logging.ERROR, logger="python-project")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("format_message should not be called")
+
+    monkeypatch.setattr(log, "format_message", fail)
+    log.info("hidden %s", 1)
+    log.success("hidden")
+    assert caplog.records == []
+
+
+def test_error_with_exception(log, caplog):
+    """Test that the exception and its traceback are appended to the error"""
+    try:
+        raise ValueError("bad value")
+    except ValueError as e:
+        log.error("Failed on %s", "item", exception=e)
+
+    record = caplog.records[-1]
+    assert record.levelno == logging.ERROR
+    assert "Failed on item" in record.getMessage()
+    assert "[ValueError] bad value" in record.getMessage()
+    assert "Traceback" in record.getMessage()
+
+
+def test_emit_skips_caller_lookup(log, caplog):
+    """Test that records are built without walking the stack"""
+    log.warning("careful")
+    record = caplog.records[-1]
+    assert record.levelno == logging.WARNING
+    assert record.lineno == 0
+    assert record.funcName is None
+
+
+def test_error_written_immediately(log):
+    """Test that errors reach the log file without waiting for a flush"""
+    log.error("boom")
+    assert "boom" in log.error_log.read_text()
+
+
+@pytest.mark.parametrize(
+    "tty,writes,sleeps",
+    [
+        pytest.param(True, 3, [0.3, 0.3, 0.15], id="tty"),
+        pytest.param(False, 1, [], id="no-tty"),
+    ],
+)
+def test_glitch_chunks(log, monkeypatch, tty, writes, sleeps):
+    """Test that glitch writes by chunks on a terminal and at once otherwise"""
+    written, slept = [], []
+    monkeypatch.setattr(log, "_tty", tty)
+    monkeypatch.setattr(log, "stdout", written.append)
+    monkeypatch.setattr(time, "sleep", slept.append)
+
+    log.glitch("0123456789", intensity=0)
+
+    assert len(written) == writes
+    assert "".join(written).count(log._end) == 10
+    assert slept == pytest.approx(sleeps)
+
+
+@pytest.mark.parametrize(
+    "fast_log,tty",
+    [
+        pytest.param(None, True, id="unset"),
+        pytest.param("0", True, id="disabled"),
+        pytest.param("1", False, id="enabled"),
+    ],
+)
+def test_fast_log_env(new_logger, monkeypatch, fast_log, tty):
+    """Test that FAST_LOG=1 disables the glitch animation on a terminal"""
+    monkeypatch.setattr("sys.stdout.isatty", lambda: True)
+    if fast_log is None:
+        monkeypatch.delenv("FAST_LOG", raising=False)
+    else:
+        monkeypatch.setenv("FAST_LOG", fast_log)
+    assert new_logger()._tty is tty
+
+
+def test_import_does_not_create_log_dir(tmp_path):
+    """Test that importing the global logger does not touch the filesystem"""
+    root = Path(__file__).resolve().parents[2]
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; sys.path.insert(0, {str(root)!r}); import src.utils",
+        ],
+        cwd=tmp_path,
+        check=True,
+    )
+    assert not (tmp_path / "logs").exists()
+
+
+@pytest.mark.parametrize(
+    "console_tty,stdout_tty",
+    [
+        pytest.param(True, False, id="stdout-redirected"),
+        pytest.param(False, True, id="stderr-redirected"),
+    ],
+)
+def test_pretty_follows_output_streams(
+    new_logger, monkeypatch, caplog, console_tty, stdout_tty
+):
+    """Test that log messages follow the console stream and glitch follows stdout"""
+    monkeypatch.setattr("sys.stderr.isatty", lambda: console_tty)
+    monkeypatch.setattr("sys.stdout.isatty", lambda: stdout_tty)
+    log = new_logger()
+    written = []
+    monkeypatch.setattr(log, "stdout", written.append)
+    monkeypatch.setattr(log, "_tty", False)
+
+    log.info({"a": 1})
+    log.glitch({"a": 1}, intensity=0)
+
+    assert ('{\n    "a": 1\n}' in caplog.records[-1].getMessage()) is console_tty
+    assert ("\n" in "".join(written)) is stdout_tty
+
+
+def test_error_log_stays_compact(new_logger, monkeypatch, caplog):
+    """Test that error.log gets compact JSON even when the console is a terminal"""
+    monkeypatch.setattr("sys.stderr.isatty", lambda: True)
+    log = new_logger()
+
+    log.error({"a": 1})
+
+    assert '{\n    "a": 1\n}' in caplog.records[-1].getMessage()
+    assert '{"a":1}' in log.error_log.read_text()
+
+
+def test_format_message_style(log):
+    """Test that each message type gets its emoji and color written once"""
+    text = log.format_message("x", msg_type="error")
+    assert text.count(Logger.COLORS["error"]) == 1
+    assert Logger.EMOJIS["error"] in text
+    assert log.format_message("x", msg_type="unknown").startswith("\n\n\n\xa0\xa0")
+
+
+@pytest.mark.parametrize(
+    "msg,renders",
+    [
+        pytest.param("boom", 1, id="plain-text"),
+        pytest.param({"a": 1}, 2, id="json"),
+    ],
+)
+def test_error_renders_compact_only_for_json(new_logger, monkeypatch, msg, renders):
+    """Test that error messages are only rendered twice when they contain JSON"""
+    monkeypatch.setattr("sys.stderr.isatty", lambda: True)
+    log = new_logger()
+    calls = []
+
+    def render(*args):
+        calls.append(args)
+        return Logger._render(*args)
+
+    monkeypatch.setattr(log, "_render", render)
+    log.error(msg)
+    assert len(calls) == renders